@@ -1,12 +1,90 @@
 import argparse
+import asyncio
+import contextlib
+import csv
+import heapq
+import json
 import sys
 import os
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import groupby, islice, takewhile
+from queue import Queue
+from threading import Event, Thread
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
-def initialize_s3(endpoint_url=None):
-    """Initialize S3 client with credentials and optional endpoint"""
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Delete requests in flight at once; each carries up to DELETE_BATCH_SIZE files,
+# so a few parallel requests hide network latency without tripping throttling
+DEFAULT_CONCURRENCY = 10
+
+# Attempts per request before a throttled or failing call is reported as an error
+MAX_RETRY_ATTEMPTS = 10
+
+# S3 returns at most 1000 versions per listing request
+LIST_PAGE_SIZE = 1000
+
+# Listing pages fetched ahead of the page being processed
+PREFETCH_PAGES = 2
+
+# S3 accepts at most 1000 keys per multi-object delete request
+DELETE_BATCH_SIZE = 1000
+
+# A dry-run file list older than this is re-listed instead of reused by --execute
+CACHE_MAX_AGE = timedelta(hours=1)
+
+# One --pretty dry-run block: file name, deleted at, size, last modified
+PRETTY_TEMPLATE = (
+    "\nWould restore: {}\n"
+    "  Deleted at: {}\n"
+    "  Original size: {}\n"
+    "  Last modified: {}\n"
+)
+
+# Binary size units indexed by bit_length() // 10: each unit spans 10 bits
+SIZE_UNITS = [(1, 'B'), (1 << 10, 'KB'), (1 << 20, 'MB'), (1 << 30, 'GB'), (1 << 40, 'TB')]
+
+@dataclass(slots=True)
+class RestorableFile:
+    """Version information for a deleted file
+
+    Slotted so that buckets with millions of deleted files don't pay for
+    a dict per entry. Only the delete marker and size are needed to restore
+    a file; the remaining fields are kept for detailed dry-run output and
+    are None otherwise.
+    """
+    delete_marker_id: str
+    size: int
+    deleted_at: datetime | None = None
+    last_modified: datetime | None = None
+
+def client_options(endpoint_url=None, concurrency=DEFAULT_CONCURRENCY):
+    """Build S3 client arguments from environment credentials and optional endpoint
+
+    The connection pool is sized to the restore concurrency so workers
+    never wait on a free HTTP connection, and TCP keepalive stops idle
+    pooled connections from being dropped mid-run. A short connect timeout
+    hands unreachable endpoints to the retry logic quickly. Adaptive retries
+    back off on throttling (SlowDown, 503) and transient network errors, so a busy
+    endpoint slows individual requests down instead of failing files.
+    """
     access_key = os.environ.get('S3_ACCESS_KEY_ID')
     secret_key = os.environ.get('S3_SECRET_ACCESS_KEY')
 
@@ -14,19 +92,30 @@ def initialize_s3(endpoint_url=None):
         print("Error: Missing S3 credentials. Please set S3_ACCESS_KEY_ID and S3_SECRET_ACCESS_KEY environment variables.")
         sys.exit(1)
 
+    return {
+        'endpoint_url': endpoint_url,
+        'aws_access_key_id': access_key,
+        'aws_secret_access_key': secret_key,
+        'config': Config(
+            max_pool_connections=concurrency,
+            tcp_keepalive=True,
+            connect_timeout=5,
+            read_timeout=60,
+            retries={'max_attempts': MAX_RETRY_ATTEMPTS, 'mode': 'adaptive'}
+        )
+    }
+
+def initialize_s3(endpoint_url=None, concurrency=DEFAULT_CONCURRENCY):
+    """Initialize S3 client with credentials and optional endpoint"""
+    options = client_options(endpoint_url, concurrency)
+
     try:
         session = boto3.session.Session()
-        s3_client = session.client(
-            's3',
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key
-        )
-        s3_client.list_buckets()  # Test credentials
+        s3_client = session.client('s3', **options)
+        # Neither credentials nor the endpoint are probed here: bad keys and
+        # unreachable endpoints surface on the first real request, which
+        # reports them as a ClientError or a connection error
         return s3_client
-    except ClientError as e:
-        print(f"Authorization error: Invalid credentials or insufficient permissions")
-        sys.exit(1)
     except Exception as e:
         print(f"Connection error: {e}")
         sys.exit(1)
@@ -44,7 +133,11 @@ def list_buckets(s3_client):
         sys.exit(1)
 
 def check_versioning_status(s3_client, bucket_name):
-    """Check if bucket versioning is enabled and supported"""
+    """Check if bucket versioning is enabled and supported
+
+    This is also the bucket access check: a missing bucket or denied access
+    fails here, so no separate head_bucket round trip is needed.
+    """
     try:
         response = s3_client.get_bucket_versioning(Bucket=bucket_name)
         status = response.get('Status', '').lower()
@@ -63,113 +156,674 @@ def check_versioning_status(s3_client, bucket_name):
     except ClientError as e:
         if e.response['Error']['Code'] == 'NotImplemented':
             print("Error: Versioning is not supported on this bucket.")
-            return False
-        raise
+        else:
+            print(f"Error accessing bucket: {e}")
+        return False
+    except BotoCoreError as e:
+        # Transport failures such as an unreachable endpoint, after retries
+        print(f"Connection error: {e}")
+        return False
 
 def format_size(size_in_bytes):
     """Format file size in bytes to human readable format"""
-    if size_in_bytes >= 1024 * 1024 * 1024:  # GB range
-        return f"{size_in_bytes / (1024 * 1024 * 1024):.2f} GB"
-    elif size_in_bytes >= 1024 * 1024:  # MB range
-        return f"{size_in_bytes / (1024 * 1024):.2f} MB"
-    elif size_in_bytes >= 1024:  # KB range
-        return f"{size_in_bytes / 1024:.2f} KB"
-    else:  # Bytes
+    if size_in_bytes < 1024:
         return f"{size_in_bytes} B"
+    unit_index = min((size_in_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    divisor, unit = SIZE_UNITS[unit_index]
+    return f"{size_in_bytes / divisor:.2f} {unit}"
 
 def format_timestamp(timestamp):
     """Convert timestamp to readable date"""
-    return timestamp.strftime('%Y-%m-%d %H:%M:%S')
+    # isoformat is implemented in C and avoids re-parsing a strftime format on
+    # every call; dropping tzinfo keeps the UTC offset out of the output
+    return timestamp.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
+
+def entry_key(item):
+    """Key name of an (entry, is_delete_marker) listing pair"""
+    return item[0]['Key']
 
-def get_restorable_files(s3_client, bucket_name, prefix=None):
+def iter_listing(pages):
+    """Yield (entry, is_delete_marker) pairs for every version in key order
+
+    Each page lists delete markers and versions separately, both sorted by
+    key; merging them keeps all entries for a key together, including when
+    a key's history continues onto the next page.
+    """
+    for page in pages:
+        yield from heapq.merge(
+            ((marker, True) for marker in page.get('DeleteMarkers', [])),
+            ((version, False) for version in page.get('Versions', [])),
+            key=entry_key
+        )
+
+def iter_restorable(pages, details=True):
+    """Yield each deleted file and the version that removing its marker restores
+
+    Entries are grouped by key in a single pass. Within a key the previous
+    version is the one with the newest LastModified, so the result doesn't
+    depend on the order a backend returns a key's versions in. Files are
+    yielded in key order as soon as their history has been read.
+
+    Args:
+        pages: Iterable of list_object_versions response pages
+        details: If False, keep only what the restore needs, not the
+            timestamps shown by a detailed dry run
+
+    Yields:
+        (file_name, RestorableFile) pairs
+    """
+    for key, history in groupby(iter_listing(pages), key=entry_key):
+        delete_marker = None
+        previous = None
+        for entry, is_delete_marker in history:
+            if is_delete_marker:
+                if entry['IsLatest']:
+                    delete_marker = entry
+            elif previous is None or entry['LastModified'] > previous['LastModified']:
+                previous = entry
+
+        # Files whose latest entry is a delete marker hiding a real version
+        if delete_marker is not None and previous is not None:
+            if details:
+                yield key, RestorableFile(
+                    delete_marker['VersionId'],
+                    previous['Size'],
+                    delete_marker['LastModified'],
+                    previous['LastModified']
+                )
+            else:
+                yield key, RestorableFile(delete_marker['VersionId'], previous['Size'])
+
+def scan_versions(pages, details=True):
+    """Collect the restorable files in a listing
+
+    Args:
+        pages: Iterable of list_object_versions response pages
+        details: If False, keep only what the restore needs for each file
+
+    Returns:
+        Tuple of (dictionary mapping file names to RestorableFile entries,
+        total size in bytes of the versions they restore)
+    """
+    restorable_files = {}
+    total_size = 0
+    for file_name, info in iter_restorable(pages, details):
+        restorable_files[file_name] = info
+        total_size += info.size
+    return restorable_files, total_size
+
+def prefetch_pages(pages, depth=PREFETCH_PAGES):
+    """Fetch listing pages on a background thread while earlier ones are processed
+
+    Each listing request waits on a round trip; fetching ahead overlaps that
+    wait with processing the previous page. Errors raised while fetching are
+    re-raised to the caller in page order.
+
+    Args:
+        pages: Iterable of listing pages, such as a paginator
+        depth: Number of pages to fetch ahead
+
+    Yields:
+        The pages, in order
+    """
+    queue = Queue(maxsize=depth)
+    done = object()
+
+    def fetch():
+        try:
+            for page in pages:
+                queue.put(page)
+        except Exception as e:
+            queue.put(e)
+        else:
+            queue.put(done)
+
+    # Daemon so an abandoned listing doesn't keep the process alive
+    Thread(target=fetch, daemon=True).start()
+    while (page := queue.get()) is not done:
+        if isinstance(page, Exception):
+            raise page
+        yield page
+
+def list_versions(s3_client, bucket_name, prefix, resume_after=None):
+    """Page through every version under a prefix
+
+    With resume_after, listing starts after that key instead of at the
+    beginning of the prefix. Pages are prefetched in the background.
+    """
+    params = {
+        'Bucket': bucket_name,
+        'Prefix': prefix,
+        'PaginationConfig': {'PageSize': LIST_PAGE_SIZE}
+    }
+    if resume_after:
+        params['KeyMarker'] = resume_after
+    paginator = s3_client.get_paginator('list_object_versions')
+    return prefetch_pages(paginator.paginate(**params))
+
+def scan_prefix(s3_client, bucket_name, prefix, resume_after=None, details=True):
+    """List every version under a prefix and return the restorable files found"""
+    return scan_versions(list_versions(s3_client, bucket_name, prefix, resume_after), details)
+
+def collect_prefixes(pages, prefixes):
+    """Pass listing pages through, appending their CommonPrefixes to prefixes"""
+    for page in pages:
+        prefixes.extend(common['Prefix'] for common in page.get('CommonPrefixes', []))
+        yield page
+
+def exit_on_listing_error(error):
+    """Report a ClientError or connection error raised while listing versions and exit"""
+    if isinstance(error, BotoCoreError):
+        print(f"Connection error: {error}")
+    elif error.response['Error']['Code'] == 'NotImplemented':
+        print("Error: This endpoint doesn't support versioning operations.")
+    else:
+        print(f"Error listing file versions: {error}")
+    sys.exit(1)
+
+def get_restorable_files(s3_client, bucket_name, prefix=None, parallel_list=None, resume_after=None,
+                         details=True):
     """Get files that can be restored by removing delete markers
 
     Args:
         s3_client: Boto3 S3 client
         bucket_name: Name of the bucket
         prefix: Optional path prefix to filter files
+        parallel_list: Optional number of top-level folders to list in
+            parallel; only used when neither prefix nor resume_after is given
+        resume_after: Optional key to start listing after
+        details: If False, keep only what the restore needs for each file,
+            saving memory on large buckets
 
     Returns:
-        Dictionary of files that can be restored with their version information
+        Tuple of (dictionary mapping file names to RestorableFile entries in
+        key order, total size in bytes of the versions they restore)
     """
-    restorable_files = {}
-    params = {'Bucket': bucket_name}
-    if prefix:
-        params['Prefix'] = prefix
-
     try:
+        if not parallel_list or prefix or resume_after:
+            return scan_prefix(s3_client, bucket_name, prefix or '', resume_after, details)
+
+        # List the top level only: files in the bucket root are handled
+        # here and each top-level folder becomes a shard listed by its own
+        # worker. Shards never share keys, so their results merge cleanly.
+        shards = []
         paginator = s3_client.get_paginator('list_object_versions')
+        restorable_files, total_size = scan_versions(collect_prefixes(
+            paginator.paginate(
+                Bucket=bucket_name,
+                Delimiter='/',
+                PaginationConfig={'PageSize': LIST_PAGE_SIZE}
+            ),
+            shards
+        ), details)
 
-        for page in paginator.paginate(**params):
-            # Process delete markers
-            for marker in page.get('DeleteMarkers', []):
-                key = marker['Key']
-                if marker['IsLatest']:
-                    restorable_files[key] = {
-                        'delete_marker_id': marker['VersionId'],
-                        'deleted_at': marker['LastModified']
-                    }
-
-            # Find the latest real version before the delete marker
-            for version in page.get('Versions', []):
-                key = version['Key']
-                if key in restorable_files and not version['IsLatest']:
-                    restorable_files[key].update({
-                        'previous_version_id': version['VersionId'],
-                        'size': version['Size'],
-                        'last_modified': version['LastModified']
-                    })
+        stop = Event()
 
-    except ClientError as e:
-        if e.response['Error']['Code'] == 'NotImplemented':
-            print("Error: This endpoint doesn't support versioning operations.")
-            sys.exit(1)
-        raise
+        def scan_shard(shard):
+            # Running shards stop at their next page once another has failed
+            pages = list_versions(s3_client, bucket_name, shard)
+            return scan_versions(takewhile(lambda page: not stop.is_set(), pages), details)
 
-    # Return only files that have both delete markers and previous versions
-    return {k: v for k, v in restorable_files.items() if 'previous_version_id' in v}
+        pool = ThreadPoolExecutor(max_workers=parallel_list)
+        try:
+            # Taken as they finish, so a failed shard isn't stuck behind
+            # earlier shards that are still listing
+            for future in as_completed([pool.submit(scan_shard, shard) for shard in shards]):
+                shard_files, shard_size = future.result()
+                restorable_files.update(shard_files)
+                total_size += shard_size
+        except BaseException:
+            # Report a failed shard right away instead of after every other
+            # shard has listed its whole subtree
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
 
-def restore_versions(s3_client, bucket_name, files_to_restore, dry_run=True, verbose=False):
-    """Restore files by removing delete markers
+        # Root files and shards interleave in key order; restore batches
+        # and --resume-after hints rely on files arriving sorted
+        return dict(sorted(restorable_files.items())), total_size
+
+    except (ClientError, BotoCoreError) as e:
+        exit_on_listing_error(e)
+
+def stream_restorable_files(s3_client, bucket_name, prefix=None, resume_after=None):
+    """Yield restorable files in key order while the bucket is still being listed
 
     Args:
         s3_client: Boto3 S3 client
         bucket_name: Name of the bucket
-        files_to_restore: Dictionary of files to restore with their version information
-        dry_run: If True, only show what would be done
-        verbose: If True, show detailed information about each file
+        prefix: Optional path prefix to filter files
+        resume_after: Optional key to start listing after
+
+    Yields:
+        (file_name, RestorableFile) pairs
     """
-    restored = 0
-    failed = 0
-
-    for file_name, info in files_to_restore.items():
-        if dry_run:
-            if verbose:
-                print(f"\nWould restore: {file_name}")
-                print(f"  Deleted at: {format_timestamp(info['deleted_at'])}")
-                print(f"  Original size: {format_size(info['size'])}")
-                print(f"  Last modified: {format_timestamp(info['last_modified'])}")
-            continue
+    try:
+        # Streamed files are only restored, never shown in detail
+        yield from iter_restorable(
+            list_versions(s3_client, bucket_name, prefix or '', resume_after),
+            details=False
+        )
+    except (ClientError, BotoCoreError) as e:
+        exit_on_listing_error(e)
+
+def dump_json(obj):
+    """Serialize an object to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def load_json(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def default_cache_path(bucket_name):
+    """Default location of the dry-run file list cache for a bucket"""
+    return f".s3restore-cache-{bucket_name}.json"
+
+def save_cache(cache_path, endpoint_url, bucket_name, prefix, resume_after, files, created_at):
+    """Save the restorable files found by a dry run so --execute can skip listing
 
+    The cache is newline-delimited JSON: a header line identifying the
+    endpoint, bucket, prefix, starting key and creation time, followed by one
+    line per file. created_at is when the files were listed, so re-saving
+    part of a cached list doesn't extend its lifetime.
+    """
+    try:
+        with open(cache_path, 'wb') as f:
+            header = {
+                'endpoint_url': endpoint_url,
+                'bucket': bucket_name,
+                'prefix': prefix,
+                'resume_after': resume_after,
+                'created_at': created_at.isoformat()
+            }
+            f.write(dump_json(header) + b'\n')
+            # --execute only needs what the restore uses, not the dry-run details
+            for file_name, info in files.items():
+                record = {'key': file_name, 'delete_marker_id': info.delete_marker_id, 'size': info.size}
+                f.write(dump_json(record) + b'\n')
+        print(f"\nSaved file list to cache: {cache_path}")
+    except OSError as e:
+        print(f"Warning: Could not write cache file {cache_path}: {e}")
+
+def load_cache(cache_path, endpoint_url, bucket_name, prefix, resume_after):
+    """Load the file list saved by a recent dry run
+
+    Returns:
+        Tuple of (dictionary of files to restore, their total size in bytes,
+        when they were listed), or None if there is no usable cache for this
+        endpoint, bucket, prefix and starting key
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            header = load_json(f.readline())
+            # Marker IDs from another endpoint would be silently accepted by a
+            # quiet delete there, so the endpoint has to match as well
+            source = (header.get('endpoint_url'), header['bucket'], header['prefix'], header['resume_after'])
+            if source != (endpoint_url, bucket_name, prefix, resume_after):
+                print(f"Ignoring cache {cache_path}: it was created for a different endpoint, bucket or path")
+                return None
+            created_at = datetime.fromisoformat(header['created_at'])
+            if datetime.now(timezone.utc) - created_at > CACHE_MAX_AGE:
+                print(f"Ignoring cache {cache_path}: it is older than {CACHE_MAX_AGE}")
+                return None
+
+            files = {}
+            total_size = 0
+            for line in f:
+                record = load_json(line)
+                files[record['key']] = RestorableFile(record['delete_marker_id'], record['size'])
+                total_size += record['size']
+            return files, total_size, created_at
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Ignoring unreadable cache {cache_path}: {e}")
+        return None
+
+def open_completed_log(log_path):
+    """Open the completed log for appending, or a no-op context without one"""
+    if not log_path:
+        return contextlib.nullcontext()
+    # Line-buffered so each batch of restored files is on disk as soon as it completes
+    return open(log_path, 'a', buffering=1)
+
+def read_completed_log(log_path):
+    """Read the names of files already restored by earlier runs"""
+    try:
+        with open(log_path) as f:
+            return set(f.read().splitlines())
+    except FileNotFoundError:
+        return set()
+
+def iter_batches(files, batch_size=DELETE_BATCH_SIZE):
+    """Split an iterable of (file_name, info) pairs into lists of at most batch_size"""
+    files = iter(files)
+    while batch := list(islice(files, batch_size)):
+        yield batch
+
+def delete_request(batch):
+    """Build the delete_objects request body that removes a batch's delete markers
+
+    Quiet mode makes S3 report only the keys that failed.
+    """
+    return {
+        'Objects': [
+            {'Key': file_name, 'VersionId': info.delete_marker_id}
+            for file_name, info in batch
+        ],
+        'Quiet': True
+    }
+
+def delete_errors(response):
+    """Map each file a delete_objects response reports as failed to its error"""
+    return {
+        error['Key']: f"{error.get('Code')}: {error.get('Message')}"
+        for error in response.get('Errors', [])
+    }
+
+def restore_batch(s3_client, bucket_name, batch):
+    """Restore a batch of files with a single multi-object delete
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket_name: Name of the bucket
+        batch: List of (file_name, RestorableFile) pairs, at most DELETE_BATCH_SIZE
+
+    Returns:
+        Dictionary mapping each file that failed to restore to its error
+    """
+    response = s3_client.delete_objects(Bucket=bucket_name, Delete=delete_request(batch))
+    return delete_errors(response)
+
+class RestoreTracker:
+    """Count restore results and report them per file or on a progress bar
+
+    Results are only recorded from one thread (the thread-pool consumer or the
+    event loop), so no locking is needed. Batches must hold files in key
+    order, as produced by the listing, for the --resume-after hint to hold.
+    """
+
+    def __init__(self, total=None, verbose=False, completed_log=None):
+        self.restored = 0
+        self.restored_size = 0
+        self.failed = []
+        self.first_failed = None
+        self.resume_after = None
+        self.batch_ends = []
+        self.completed_log = completed_log
+        self.progress = create_progress_bar(total, verbose)
+
+    def record_batch(self, batch, errors):
+        """Record the outcome of a batch given the errors for its failed files
+
+        Per-file output and completed-log lines are collected for the whole
+        batch and written once, instead of a write (and, for the line
+        buffered log, a flush) per file. With a progress bar only errors are
+        shown, above the bar, in one redraw per batch.
+        """
+        lines = []
+        completed = []
+        previous = None
+        for file_name, info in batch:
+            error = errors.get(file_name)
+            if error is not None:
+                lines.append(f"Error restoring {file_name}: {error}")
+                self.failed.append(file_name)
+                if self.first_failed is None or file_name < self.first_failed:
+                    self.first_failed = file_name
+                    self.resume_after = previous
+            else:
+                if self.progress is None:
+                    lines.append(f"Successfully restored: {file_name}")
+                completed.append(file_name)
+                self.restored += 1
+                self.restored_size += info.size
+            previous = file_name
+        if lines:
+            if self.progress is None:
+                sys.stdout.write('\n'.join(lines) + '\n')
+            else:
+                self.progress.write('\n'.join(lines))
+        if completed and self.completed_log is not None:
+            self.completed_log.write('\n'.join(completed) + '\n')
+        self.batch_ends.append(previous)
+        if self.progress is not None:
+            self.progress.update(len(batch))
+
+    def record_future(self, future, batch):
+        """Record the outcome of a restore_batch future"""
         try:
-            print(f"Restoring: {file_name}")
-            s3_client.delete_object(
-                Bucket=bucket_name,
-                Key=file_name,
-                VersionId=info['delete_marker_id']
-            )
-            print(f"Successfully restored: {file_name}")
-            restored += 1
+            errors = future.result()
         except Exception as e:
-            print(f"Error restoring {file_name}: {e}")
-            failed += 1
-            continue
+            # The request itself failed, so nothing in the batch was restored
+            errors = {file_name: e for file_name, _ in batch}
+        self.record_batch(batch, errors)
+
+    def finish(self):
+        """Close the progress bar and print the restore summary
 
-    if not dry_run:
+        Returns:
+            list: Names of the files that failed to restore
+        """
+        if self.progress is not None:
+            self.progress.close()
         print(f"\nRestore summary:")
-        print(f"Successfully restored: {restored} files")
-        if failed > 0:
-            print(f"Failed to restore: {failed} files")
+        print(f"Successfully restored: {self.restored} files ({format_size(self.restored_size)})")
+        if self.failed:
+            print(f"Failed to restore: {len(self.failed)} files")
+            self.print_resume_hint()
+        return self.failed
+
+    def print_resume_hint(self):
+        """Suggest a --resume-after key that skips the files before the first failure"""
+        # Batches are contiguous runs of the key-ordered listing: if the first
+        # failure opened its batch, the key before it ended an earlier batch
+        resume_after = self.resume_after
+        if resume_after is None:
+            resume_after = max(
+                (end for end in self.batch_ends if end < self.first_failed),
+                default=None
+            )
+        if resume_after is not None:
+            print(f"To retry without re-listing earlier files, rerun with: --resume-after '{resume_after}'")
+
+def create_progress_bar(total=None, verbose=False):
+    """Create a progress bar for a restore, or None to print each file instead
+
+    tqdm redraws at a bounded rate, so a large restore doesn't pay for two
+    stdout writes per file. Per-file output is kept with --verbose or when
+    tqdm isn't installed. Without a total, tqdm shows a running count.
+    """
+    if verbose or tqdm is None:
+        return None
+    return tqdm(total=total, unit='file', desc='Restoring')
+
+def preview_restore(files_to_restore, verbose=False, pretty=False, output=None):
+    """Show which files a restore would recover without changing the bucket
+
+    Args:
+        files_to_restore: Dictionary mapping file names to RestorableFile entries
+        verbose: If True, show detailed information about each file as CSV
+        pretty: If True, show detailed information as human-readable text
+        output: Stream to write the details to (default: sys.stdout)
+    """
+    output = output or sys.stdout
+    if pretty:
+        # Build the report first and write it once rather than issuing
+        # a stdout write per line on large dry runs; each file's block comes
+        # from one bound template call
+        render = PRETTY_TEMPLATE.format
+        output.write(''.join(
+            render(
+                file_name,
+                format_timestamp(info.deleted_at),
+                format_size(info.size),
+                format_timestamp(info.last_modified)
+            )
+            for file_name, info in files_to_restore.items()
+        ))
+    elif verbose:
+        # One machine-readable row per file rather than a block of lines
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerow(['file', 'deleted_at', 'size', 'last_modified'])
+        writer.writerows(
+            (file_name, format_timestamp(info.deleted_at), format_size(info.size),
+             format_timestamp(info.last_modified))
+            for file_name, info in files_to_restore.items()
+        )
+
+def run_batches(s3_client, bucket_name, batches, tracker, concurrency=DEFAULT_CONCURRENCY):
+    """Send restore batches from a thread pool and record their results
+
+    At most two rounds of batches are queued at once. If the run is
+    interrupted, by Ctrl-C or by an error raised while batches are being
+    produced (such as a failed listing), queued batches are cancelled and
+    the requests already sent are allowed to finish and recorded before
+    the exception propagates, so --completed-log holds every restored file.
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket_name: Name of the bucket
+        batches: Iterable of batches of (file_name, RestorableFile) pairs
+        tracker: RestoreTracker that records each batch's outcome
+        concurrency: Number of delete requests to run in parallel
+    """
+    pending = {}
+
+    # botocore clients are thread-safe, so all workers share the one client
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        for batch in batches:
+            while len(pending) >= 2 * concurrency:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    tracker.record_future(future, pending.pop(future))
+            pending[pool.submit(restore_batch, s3_client, bucket_name, batch)] = batch
+
+        for future in as_completed(pending):
+            tracker.record_future(future, pending.pop(future))
+    except BaseException:
+        pool.shutdown(cancel_futures=True)
+        for future, batch in pending.items():
+            if not future.cancelled():
+                tracker.record_future(future, batch)
+        tracker.finish()
+        raise
+    pool.shutdown()
+
+def restore_versions(s3_client, bucket_name, files_to_restore, verbose=False,
+                     concurrency=DEFAULT_CONCURRENCY, completed_log=None):
+    """Restore files by removing delete markers
+
+    Delete markers are removed up to DELETE_BATCH_SIZE at a time with
+    delete_objects, and batches are sent in parallel.
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket_name: Name of the bucket
+        files_to_restore: Dictionary mapping file names to RestorableFile entries
+        verbose: If True, print each file as it is restored instead of a progress bar
+        concurrency: Number of delete requests to run in parallel
+        completed_log: Optional open file that each restored file name is appended to
+
+    Returns:
+        list: Names of the files that failed to restore
+    """
+    tracker = RestoreTracker(len(files_to_restore), verbose, completed_log)
+    run_batches(s3_client, bucket_name, iter_batches(files_to_restore.items()), tracker, concurrency)
+    return tracker.finish()
+
+def restore_stream(s3_client, bucket_name, files, verbose=False, concurrency=DEFAULT_CONCURRENCY,
+                   completed_log=None):
+    """Restore files as they are listed instead of after the listing completes
+
+    Each batch is submitted as soon as it fills, so deletes start after the
+    first listing page and overlap with the rest of the listing.
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket_name: Name of the bucket
+        files: Iterable of (file_name, RestorableFile) pairs in key order
+        verbose: If True, print each restored file instead of a progress bar
+        concurrency: Number of delete requests to run in parallel
+        completed_log: Optional open file that each restored file name is appended to
+
+    Returns:
+        list: Names of the files that failed to restore
+    """
+    tracker = RestoreTracker(verbose=verbose, completed_log=completed_log)
+    # Listing runs while batches are pulled, so it stays at most one round
+    # of batches ahead of the deletes
+    run_batches(s3_client, bucket_name, iter_batches(files), tracker, concurrency)
+    return tracker.finish()
+
+async def restore_versions_async(bucket_name, files_to_restore, options, verbose=False,
+                                 concurrency=DEFAULT_CONCURRENCY, completed_log=None):
+    """Restore files by removing delete markers using asyncio and aioboto3
+
+    Same result as restore_versions with execution enabled, but requests are
+    issued from a single event loop instead of a thread pool, which keeps many
+    more requests in flight for the same memory.
+
+    Args:
+        bucket_name: Name of the bucket
+        files_to_restore: Dictionary mapping file names to RestorableFile entries
+        options: S3 client arguments from client_options()
+        verbose: If True, print each restored file instead of a progress bar
+        concurrency: Maximum number of delete requests in flight
+        completed_log: Optional open file that each restored file name is appended to
+
+    Returns:
+        list: Names of the files that failed to restore
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    tracker = RestoreTracker(len(files_to_restore), verbose, completed_log)
+
+    try:
+        async with aioboto3.Session().client('s3', **options) as s3_client:
+            async def send(batch):
+                response = await s3_client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete=delete_request(batch)
+                )
+                return delete_errors(response)
+
+            async def restore_one(batch):
+                async with semaphore:
+                    # Shielded so that on Ctrl-C a request already sent still
+                    # completes and is recorded; batches waiting on the
+                    # semaphore are cancelled before they are sent
+                    request = asyncio.ensure_future(send(batch))
+                    try:
+                        await asyncio.shield(request)
+                    except asyncio.CancelledError:
+                        await asyncio.wait([request])
+                        raise
+                    except Exception:
+                        # record_future reports the error for the whole batch
+                        pass
+                    finally:
+                        if request.done():
+                            tracker.record_future(request, batch)
+
+            # return_exceptions keeps gather waiting for every batch when it
+            # is cancelled, rather than returning as soon as the first one stops
+            results = await asyncio.gather(*(
+                restore_one(batch) for batch in iter_batches(files_to_restore.items())
+            ), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+    except BaseException:
+        tracker.finish()
+        raise
+
+    return tracker.finish()
 
 def main():
     parser = argparse.ArgumentParser(
@@ -186,18 +840,52 @@ Examples:
     # Restore files using path prefix
     %(prog)s my-bucket --path docs/reports/
 
-    # Show detailed information
-    %(prog)s my-bucket -v
+    # Save detailed information as CSV
+    %(prog)s my-bucket -v > deleted-files.csv
+
+    # Show detailed information as readable text
+    %(prog)s my-bucket --pretty
 
     # Execute restoration
     %(prog)s my-bucket --execute
 
+    # List top-level folders of a large bucket in parallel
+    %(prog)s my-bucket --parallel-list 16
+
+    # Start restoring as soon as the first files are listed
+    %(prog)s my-bucket --execute --stream
+
+    # Continue a restore from a known key
+    %(prog)s my-bucket --execute --resume-after docs/reports/q3.pdf
+
+    # Record restored files so an interrupted run can pick up where it left off
+    %(prog)s my-bucket --execute --completed-log restored.log
+
+    # Always re-list the bucket instead of reusing the dry-run file list
+    %(prog)s my-bucket --execute --no-cache
+
 Notes:
     - The script requires S3_ACCESS_KEY_ID and S3_SECRET_ACCESS_KEY environment variables
     - Bucket must have versioning enabled
     - Path is optional and uses prefix matching
     - Default is dry-run mode; use --execute to perform operations
-    - Use -v or --verbose to see detailed information about each file
+    - Use -v or --verbose to see detailed information about each file as CSV,
+      or --pretty for a readable multi-line report; in a -v dry run only the
+      CSV goes to stdout, so it can be redirected or piped on its own
+    - Use --concurrency (or --max-concurrency) to tune how many delete requests
+      of up to 1000 files each run in parallel
+    - --async uses aioboto3 instead of threads for --execute; the thread pool
+      remains the default since aiobotocore lags botocore releases and does
+      not work with moto's in-process mocks
+    - --stream confirms before listing and skips the file count, the dry-run
+      cache and --parallel-list; totals are shown in the final summary
+    - --skip-checks (or --skip-versioning-check) saves a round trip per run when
+      the bucket is known to be versioned; listing errors are still reported
+    - A dry run caches the files it found; --execute reuses that list for up
+      to an hour instead of listing the bucket again
+    - A restore with failures keeps the failed files in the cache, so a rerun
+      within the hour retries only those without re-listing
+    - The exit status is 1 if any file failed to restore
 ''')
 
     parser.add_argument(
@@ -223,6 +911,12 @@ Notes:
         metavar='PREFIX'
     )
 
+    parser.add_argument(
+        '--resume-after',
+        help='Only consider files whose names sort after KEY, e.g. to resume a failed run',
+        metavar='KEY'
+    )
+
     parser.add_argument(
         '--execute',
         action='store_true',
@@ -232,7 +926,70 @@ Notes:
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
-        help='Show detailed information about files to be restored'
+        help='Show detailed information about files to be restored, one CSV row per file'
+    )
+
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Show detailed information about files to be restored as readable text'
+    )
+
+    parser.add_argument(
+        '--concurrency', '--max-concurrency',
+        dest='concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Number of delete requests (up to 1000 files each) to run in parallel '
+             f'(default: {DEFAULT_CONCURRENCY})',
+        metavar='N'
+    )
+
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Issue restore requests from an asyncio event loop (requires aioboto3)'
+    )
+
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='With --execute, restore files while the bucket is still being listed '
+             'instead of listing everything first'
+    )
+
+    parser.add_argument(
+        '--parallel-list',
+        type=int,
+        help='List up to N top-level folders in parallel (ignored with --path or --resume-after)',
+        metavar='N'
+    )
+
+    parser.add_argument(
+        '--skip-checks', '--skip-versioning-check',
+        dest='skip_checks',
+        action='store_true',
+        help='Skip the bucket versioning check before listing'
+    )
+
+    parser.add_argument(
+        '--completed-log',
+        help='Append each restored file to PATH and skip files already listed there',
+        metavar='PATH'
+    )
+
+    parser.add_argument(
+        '--cache',
+        help='File list cache written by dry runs and read by --execute '
+             '(default: .s3restore-cache-BUCKET.json)',
+        metavar='PATH'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the file list cache'
     )
 
     args = parser.parse_args()
@@ -240,40 +997,119 @@ Notes:
     # Validate required arguments
     if not args.list_buckets and not args.bucket_name:
         parser.error("Bucket name is required unless using --list-buckets")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.parallel_list is not None and args.parallel_list < 1:
+        parser.error("--parallel-list must be at least 1")
+    if args.use_async and aioboto3 is None:
+        parser.error("--async requires aioboto3 (pip install aioboto3)")
+    if args.stream and not args.execute:
+        parser.error("--stream requires --execute")
+    if args.stream and args.use_async:
+        parser.error("--stream cannot be combined with --async")
+
+    if args.verbose and not (args.pretty or args.execute or args.list_buckets):
+        # The CSV is the only thing written to stdout, so it can be piped
+        # into other tools; status messages go to stderr instead
+        output = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            run(args, output)
+    else:
+        run(args)
 
+def run(args, output=None):
+    """Find and restore deleted files as requested on the command line
+
+    Args:
+        args: Parsed command-line arguments
+        output: Stream for the dry-run details (default: sys.stdout)
+    """
     print("Initializing S3 client...")
-    s3_client = initialize_s3(args.endpoint_url)
+    s3_client = initialize_s3(args.endpoint_url, max(args.concurrency, args.parallel_list or 0))
 
     if args.list_buckets:
         list_buckets(s3_client)
         return
 
-    try:
-        s3_client.head_bucket(Bucket=args.bucket_name)
+    if not args.skip_checks:
+        if not check_versioning_status(s3_client, args.bucket_name):
+            sys.exit(1)
         print(f"Connected to bucket: {args.bucket_name}")
-    except ClientError as e:
-        print(f"Error accessing bucket: {e}")
-        sys.exit(1)
-
-    if not check_versioning_status(s3_client, args.bucket_name):
-        sys.exit(1)
 
     if args.path:
         print(f"Using path prefix: {args.path}")
+    if args.resume_after:
+        print(f"Resuming after: {args.resume_after}")
 
-    print("\nFinding deleted files that can be restored...")
-    files = get_restorable_files(
-        s3_client,
-        args.bucket_name,
-        args.path
-    )
+    if args.stream:
+        # Nothing is known about the files until they are listed, so the
+        # confirmation has to come first
+        location = f"under {args.path}" if args.path else "in the bucket"
+        print(f"\nThis will remove delete markers to restore the most recent version of every "
+              f"deleted file {location} as soon as it is listed.")
+        confirm = input("Continue with restoration? (yes/no): ")
+        if confirm.lower() != 'yes':
+            print("Operation aborted.")
+            return
+
+        files = stream_restorable_files(s3_client, args.bucket_name, args.path, args.resume_after)
+        if args.completed_log:
+            completed = read_completed_log(args.completed_log)
+            files = (item for item in files if item[0] not in completed)
+
+        print("\nRestoring deleted files while listing...")
+        with open_completed_log(args.completed_log) as completed_log:
+            failed = restore_stream(
+                s3_client,
+                args.bucket_name,
+                files,
+                verbose=args.verbose,
+                concurrency=args.concurrency,
+                completed_log=completed_log
+            )
+        if failed:
+            sys.exit(1)
+        return
+
+    cache_path = None
+    if not args.no_cache:
+        cache_path = args.cache or default_cache_path(args.bucket_name)
+
+    cached = None
+    if args.execute and cache_path:
+        cached = load_cache(cache_path, args.endpoint_url, args.bucket_name, args.path, args.resume_after)
+
+    if cached is not None:
+        print(f"\nUsing file list cached by an earlier run: {cache_path}")
+        files, total_size, listed_at = cached
+    else:
+        listed_at = datetime.now(timezone.utc)
+        print("\nFinding deleted files that can be restored...")
+        files, total_size = get_restorable_files(
+            s3_client,
+            args.bucket_name,
+            args.path,
+            args.parallel_list,
+            args.resume_after,
+            # Timestamps are only shown by a detailed dry run
+            details=not args.execute and (args.verbose or args.pretty)
+        )
 
     if not files:
         print(f"No deleted files found in bucket" + (f" at path: {args.path}" if args.path else "."))
         return
 
+    if args.completed_log:
+        completed = read_completed_log(args.completed_log).intersection(files)
+        if completed:
+            print(f"Skipping {len(completed)} files already restored according to {args.completed_log}")
+            for file_name in completed:
+                total_size -= files.pop(file_name).size
+            if not files:
+                print("All deleted files have already been restored.")
+                return
+
     print(f"\nFound {len(files)} deleted files that can be restored")
-    total_size = sum(info['size'] for info in files.values())
     print(f"Total size of files to restore: {format_size(total_size)}")
 
     if args.execute:
@@ -283,13 +1119,50 @@ Notes:
             print("Operation aborted.")
             return
 
-    restore_versions(
-        s3_client,
-        args.bucket_name,
-        files,
-        dry_run=not args.execute,
-        verbose=args.verbose
-    )
+    failed = []
+    if not args.execute:
+        preview_restore(files, verbose=args.verbose, pretty=args.pretty, output=output)
+    else:
+        with open_completed_log(args.completed_log) as completed_log:
+            if args.use_async:
+                failed = asyncio.run(restore_versions_async(
+                    args.bucket_name,
+                    files,
+                    client_options(args.endpoint_url, args.concurrency),
+                    verbose=args.verbose,
+                    concurrency=args.concurrency,
+                    completed_log=completed_log
+                ))
+            else:
+                failed = restore_versions(
+                    s3_client,
+                    args.bucket_name,
+                    files,
+                    verbose=args.verbose,
+                    concurrency=args.concurrency,
+                    completed_log=completed_log
+                )
+
+    if cache_path:
+        if not args.execute:
+            save_cache(cache_path, args.endpoint_url, args.bucket_name, args.path, args.resume_after,
+                       files, listed_at)
+        elif failed:
+            # Keep just the failed files so a rerun retries them without
+            # re-listing, and keep the listing time so the cache still expires.
+            # failed is in completion order; the cache keeps listing (key)
+            # order so the rerun's batches and --resume-after hint stay valid
+            failed = set(failed)
+            save_cache(cache_path, args.endpoint_url, args.bucket_name, args.path, args.resume_after,
+                       {file_name: info for file_name, info in files.items() if file_name in failed},
+                       listed_at)
+        elif cached is not None:
+            # The cached list is spent once the restore has run; a cache that
+            # was rejected belongs to another run and is left alone
+            os.remove(cache_path)
+
+    if failed:
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file